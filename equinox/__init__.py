@@ -9,7 +9,7 @@ from .filters import (
 )
 from .gradf import gradf, value_and_grad_f
 from .jitf import jitf
-from .module import Module
+from .module import Module, static_field
 from .tree import tree_at, tree_equal
 from .update import apply_updates
 
@@ -1,3 +1,4 @@
+from itertools import compress
 from typing import Any, Callable, List, Optional, Tuple
 from typing_extensions import get_args
 
@@ -10,6 +11,18 @@ from .custom_types import Array, MoreArrays, PyTree, TreeDef
 _array_types = get_args(Array)
 _morearray_types = get_args(MoreArrays)
 _arraylike_types = _morearray_types + (int, float, complex, bool)
+_inexact_scalar_types = (float, complex)
+# Floating and complex floating dtypes.
+_inexact_kinds = frozenset("fc")
+
+
+# Checking `dtype.kind` is a single attribute lookup, in contrast to the more general
+# `jnp.issubdtype`. Extension dtypes like bfloat16 have kind "V", so fall back for those.
+def _is_inexact_dtype(dtype) -> bool:
+    kind = dtype.kind
+    return kind in _inexact_kinds or (
+        kind == "V" and jnp.issubdtype(dtype, jnp.inexact)
+    )
 
 
 # TODO: not sure if this is the best way to do this? In light of:
@@ -19,19 +32,24 @@ def is_array(element: Any) -> bool:
 
 
 # Does _not_ do a try/except on jnp.asarray(element) because that's very slow.
+# Python floats and ints are common leaves, so check for them by identity first rather
+# than scanning the whole tuple of types.
 def is_array_like(element: Any) -> bool:
+    t = type(element)
+    if t is float or t is int:
+        return True
     return isinstance(element, _arraylike_types)
 
 
 def is_inexact_array(element: Any) -> bool:
-    return is_array(element) and jnp.issubdtype(element.dtype, jnp.inexact)
+    return is_array(element) and _is_inexact_dtype(element.dtype)
 
 
+# Python scalars are checked first as they're the cheapest case.
 def is_inexact_array_like(element: Any) -> bool:
-    return (
-        isinstance(element, _morearray_types)
-        and jnp.issubdtype(element.dtype, jnp.inexact)
-    ) or isinstance(element, (float, complex))
+    if isinstance(element, _inexact_scalar_types):
+        return True
+    return isinstance(element, _morearray_types) and _is_inexact_dtype(element.dtype)
 
 
 def split(
@@ -40,10 +58,12 @@ def split(
     filter_tree: Optional[PyTree] = None,
 ) -> Tuple[List[Any], List[Any], List[bool], TreeDef]:
 
-    validate_filters("split", filter_fn, filter_tree)
+    # Inlined version of `validate_filters`, as this is on the hot path.
+    if (filter_fn is None) == (filter_tree is None):
+        raise ValueError(
+            "Precisely one of `filter_fn` and `filter_tree` should be passed to split"
+        )
     flat, treedef = jax.tree_flatten(pytree)
-    flat_true = []
-    flat_false = []
 
     if filter_fn is None:
         which, treedef_filter = jax.tree_flatten(filter_tree)
@@ -51,20 +71,11 @@ def split(
             raise ValueError(
                 "filter_tree must have the same tree structure as the PyTree being split."
             )
-        for f, w in zip(flat, which):
-            if w:
-                flat_true.append(f)
-            else:
-                flat_false.append(f)
     else:
-        which = []
-        for f in flat:
-            if filter_fn(f):
-                flat_true.append(f)
-                which.append(True)
-            else:
-                flat_false.append(f)
-                which.append(False)
+        which = [bool(filter_fn(f)) for f in flat]
+    # Partition with itertools.compress, which loops in C rather than Python.
+    flat_true = list(compress(flat, which))
+    flat_false = list(compress(flat, [not w for w in which]))
 
     return flat_true, flat_false, which, treedef
 
@@ -72,14 +83,15 @@ def split(
 def merge(
     flat_true: List[Any], flat_false: List[Any], which: List[bool], treedef: TreeDef
 ):
-    flat = []
-    flat_true = iter(flat_true)
-    flat_false = iter(flat_false)
-    for element in which:
+    flat = [None] * len(which)
+    t = f = 0
+    for i, element in enumerate(which):
         if element:
-            flat.append(next(flat_true))
+            flat[i] = flat_true[t]
+            t += 1
         else:
-            flat.append(next(flat_false))
+            flat[i] = flat_false[f]
+            f += 1
     return jax.tree_unflatten(treedef, flat)
 
 
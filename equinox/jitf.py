@@ -1,10 +1,34 @@
 import functools as ft
+import weakref
 from dataclasses import dataclass
 from typing import Any
 
 import jax
 
 from .filters import validate_filters
+from .module import Module
+
+
+# Modules hash and compare by value, so using them directly as cache keys would compare
+# their arrays on every lookup, and would keep every Module passed to jitf alive. So
+# they are keyed by identity instead, and only weakly referenced.
+class _WeakIdKey:
+    def __init__(self, obj):
+        self.ref = weakref.ref(obj)
+        self.id = id(obj)
+
+    def __hash__(self):
+        return self.id
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, _WeakIdKey)
+            and self.id == other.id
+            and self.ref() is other.ref()
+        )
+
+    def __call__(self, *args):
+        return self.ref()(*args)
 
 
 @ft.lru_cache(maxsize=4096)
@@ -54,6 +78,11 @@ def jitf(
         raise NotImplementedError("jitf does not ye support `donate_argnums`.")
     validate_filters("jitf", filter_fn, filter_tree)
 
+    if isinstance(fun, Module):
+        fun_key = _WeakIdKey(fun)
+    else:
+        fun_key = fun
+
     if static_argnums is None:
         len_static_argnums = 0
     else:
@@ -110,7 +139,7 @@ def jitf(
             ]
 
         f_jitted = _jitf_cache(
-            fun, args_treedef, static_argnums=new_static_argnums, **jitkwargs
+            fun_key, args_treedef, static_argnums=new_static_argnums, **jitkwargs
         )
         return f_jitted(*args_flat)
 
@@ -1,23 +1,48 @@
 import abc
-from dataclasses import dataclass, fields
+import operator
+from dataclasses import dataclass, field, fields, MISSING
 
 import jax
 
 from .tree import tree_equal
 
 
-# dataclasses.astuple operates recursively, which destroys information about
-# nested tree_dataclasses. In contrast this is just a shallow tuplification.
-def _dataclass_astuple(cls):
-    return tuple(getattr(cls, field.name) for field in fields(cls) if field.init)
+def static_field(**kwargs):
+    """Declares a field of a Module that is not part of its PyTree, e.g. a Python int
+    describing a shape. It is instead stored in the auxiliary data of the PyTree, and
+    so is never a leaf to be traced, filtered or mapped over.
+    """
+    metadata = dict(kwargs.pop("metadata", {}))
+    metadata["static"] = True
+    return field(metadata=metadata, **kwargs)
 
 
-def _allow_setattr(fields):
+# Like operator.attrgetter, but always returns a tuple. This is a C-level loop rather
+# than a Python one.
+def _tuple_getter(names):
+    if len(names) == 0:
+        return lambda self: ()
+    elif len(names) == 1:
+        getter = operator.attrgetter(names[0])
+        return lambda self: (getter(self),)
+    else:
+        return operator.attrgetter(*names)
+
+
+# The ids of those Modules currently running their __init__. Only these are allowed to
+# have their fields set, so that no class-level state needs to be mutated per instance.
+_initialising = set()
+
+
+def _allow_setattr(field_names, frozen_setattr):
     def __setattr__(self, name, value):
-        if name in fields:
-            object.__setattr__(self, name, value)
+        if id(self) in _initialising:
+            if name in field_names:
+                object.__setattr__(self, name, value)
+            else:
+                raise AttributeError(f"Cannot set attribute {name}")
         else:
-            raise AttributeError(f"Cannot set attribute {name}")
+            frozen_setattr(self, name, value)
 
     return __setattr__
 
@@ -41,6 +66,11 @@ class _ModuleMeta(abc.ABCMeta):
         assert "__dataclass_setattr__" not in cls.__dict__
         cls.__dataclass_init__ = cls.__init__
         cls.__dataclass_setattr__ = cls.__setattr__
+        # Computed once here rather than on every instantiation.
+        cls.__equinox_field_names__ = frozenset(field.name for field in fields(cls))
+        cls.__setattr__ = _allow_setattr(
+            cls.__equinox_field_names__, cls.__dataclass_setattr__
+        )
         if not reinstate_init:
             # Override the default dataclass init if our parent has an init
             for kls in cls.__mro__[1:-1]:
@@ -54,12 +84,49 @@ class _ModuleMeta(abc.ABCMeta):
         if reinstate_init:
             cls.__init__ = user_provided_init
 
-        def flatten(self):
-            return _dataclass_astuple(self), None
+        # dataclasses.astuple operates recursively, which destroys information about
+        # nested Modules. In contrast this is just a shallow tuplification, over names
+        # computed once here rather than via `fields` on every flatten.
+        dynamic_names = []
+        static_names = []
+        # Non-init fields aren't flattened, but are set by the dataclass __init__ that
+        # unflatten doesn't call, so restore them separately. As in that __init__, this
+        # includes running __post_init__, which may derive them from the other fields.
+        noninit_defaults = []
+        for f in fields(cls):
+            if f.init:
+                if f.metadata.get("static", False):
+                    static_names.append(f.name)
+                else:
+                    dynamic_names.append(f.name)
+            elif f.default is not MISSING or f.default_factory is not MISSING:
+                noninit_defaults.append((f.name, f.default, f.default_factory))
+        dynamic_names = tuple(dynamic_names)
+        static_names = tuple(static_names)
+        get_dynamic = _tuple_getter(dynamic_names)
+        get_static = _tuple_getter(static_names)
+        post_init = getattr(cls, "__post_init__", None)
 
-        def unflatten(_, fields):
-            self = cls.__new__(cls, *fields)
-            cls.__dataclass_init__(self, *fields)
+        def flatten(self):
+            return get_dynamic(self), get_static(self)
+
+        def unflatten(static, dynamic, _new=cls.__new__, _setattr=object.__setattr__):
+            self = _new(cls)
+            for name, value in zip(dynamic_names, dynamic):
+                _setattr(self, name, value)
+            for name, value in zip(static_names, static):
+                _setattr(self, name, value)
+            for name, default, default_factory in noninit_defaults:
+                if default_factory is MISSING:
+                    _setattr(self, name, default)
+                else:
+                    _setattr(self, name, default_factory())
+            if post_init is not None:
+                _initialising.add(id(self))
+                try:
+                    post_init(self)
+                finally:
+                    _initialising.discard(id(self))
             return self
 
         jax.tree_util.register_pytree_node(cls, flatten, unflatten)
@@ -67,12 +134,18 @@ class _ModuleMeta(abc.ABCMeta):
 
     def __call__(cls, *args, **kwargs):
         self = cls.__new__(cls, *args, **kwargs)
-        # Defreeze it during __init__. TODO: this isn't thread/recursion-safe.
-        field_names = {field.name for field in fields(cls)}
-        cls.__setattr__ = _allow_setattr(field_names)
-        cls.__init__(self, *args, **kwargs)
-        cls.__setattr__ = cls.__dataclass_setattr__
-        missing_names = {name for name in field_names if name not in dir(self)}
+        # Defreeze it during __init__.
+        _initialising.add(id(self))
+        try:
+            cls.__init__(self, *args, **kwargs)
+        finally:
+            _initialising.discard(id(self))
+        # Fields with defaults are still available as class attributes.
+        missing_names = {
+            name
+            for name in cls.__equinox_field_names__ - self.__dict__.keys()
+            if not hasattr(cls, name)
+        }
         if len(missing_names):
             raise ValueError(
                 f"The following fields were not initialised during __init__: {missing_names}"
@@ -82,4 +155,17 @@ class _ModuleMeta(abc.ABCMeta):
 
 class Module(metaclass=_ModuleMeta):
     def __eq__(self, other):
+        if self is other:
+            return True
+        if type(self) is not type(other):
+            return NotImplemented
         return tree_equal(self, other)
+
+    # Modules typically contain unhashable arrays, so only hash their tree structure.
+    # Modules that are equal under `tree_equal` have the same structure, so this is
+    # consistent with __eq__. The trade-off is that all Modules of the same structure
+    # collide, so dict/set/lru_cache lookups fall back to `__eq__`, which compares every
+    # array leaf. Caches keyed on frequently-changing Modules should key on identity
+    # instead, as `jitf` does.
+    def __hash__(self):
+        return hash((type(self), jax.tree_structure(self)))
@@ -1,19 +1,27 @@
 import math
 from typing import Optional
 
+import jax.numpy as jnp
 import jax.random as jrandom
 
 from ..custom_types import Array
-from ..module import Module
+from ..module import Module, static_field
 
 
 class Linear(Module):
     weight: Array
     bias: Optional[Array]
+    in_features: int = static_field()
+    out_features: int = static_field()
 
     def __init__(self, in_features, out_features, use_bias=True, *, key):
         super().__init__()
-        wkey, bkey = jrandom.split(key, 2)
+        self.in_features = in_features
+        self.out_features = out_features
+        if use_bias:
+            wkey, bkey = jrandom.split(key, 2)
+        else:
+            wkey = key
         lim = 1 / math.sqrt(in_features)
         self.weight = jrandom.uniform(
             wkey, (out_features, in_features), minval=-lim, maxval=lim
@@ -24,7 +32,7 @@ class Linear(Module):
             self.bias = None
 
     def __call__(self, x, *, key=None):
-        x = self.weight @ x
+        x = jnp.dot(self.weight, x)
         if self.bias is not None:
             x = x + self.bias
         return x
@@ -40,8 +40,14 @@ def get_data(dataset_size, *, key):
     return x, y
 
 
+# Defined at the top level, and with `cell` passed explicitly, so that only the cell
+# (and not the whole RNN) is closed over by lax.scan.
+def _rnn_step(cell, carry, inp):
+    return cell(inp, carry), None
+
+
 class RNN(eqx.Module):
-    hidden_size: int
+    hidden_size: int = eqx.static_field()
     cell: eqx.Module
     linear: eqx.nn.Linear
 
@@ -53,11 +59,7 @@ class RNN(eqx.Module):
 
     def __call__(self, input):
         hidden = jnp.zeros((self.hidden_size,))
-
-        def f(carry, inp):
-            return self.cell(inp, carry), None
-
-        out, _ = lax.scan(f, hidden, input)
+        out, _ = lax.scan(ft.partial(_rnn_step, self.cell), hidden, input)
         return jax.nn.sigmoid(self.linear(out))
 
 
@@ -79,6 +81,8 @@ def main(
     @ft.partial(eqx.jitf, filter_fn=eqx.is_inexact_array)
     @ft.partial(eqx.value_and_grad_f, filter_fn=eqx.is_inexact_array)
     def loss(model, x, y):
+        # vmap-of-scan is batched into a single scan over time, so each step is one
+        # batched matrix multiply. No need to move the batch axis inside by hand.
         pred_y = jax.vmap(model)(x)
         # Trains with respect to binary cross-entropy
         return -jnp.mean(y * jnp.log(pred_y) + (1 - y) * jnp.log(1 - pred_y))
@@ -78,6 +78,15 @@ def test_is_inexact_array_like(getkey):
         assert eqx.is_inexact_array_like(o) == r
 
 
+def test_is_inexact_array_dtypes():
+    for dtype in (jnp.float16, jnp.bfloat16, jnp.float32, jnp.complex64):
+        assert eqx.is_inexact_array(jnp.array(1, dtype=dtype))
+        assert eqx.is_inexact_array_like(jnp.array(1, dtype=dtype))
+    for dtype in (jnp.bool_, jnp.int8, jnp.int32, jnp.uint32):
+        assert not eqx.is_inexact_array(jnp.array(1, dtype=dtype))
+        assert not eqx.is_inexact_array_like(jnp.array(1, dtype=dtype))
+
+
 def test_splitfn_and_merge(getkey):
     filter_fn = lambda x: isinstance(x, int)
     for pytree in (
@@ -1,4 +1,6 @@
 import functools as ft
+import gc
+import weakref
 
 import jax
 import jax.numpy as jnp
@@ -205,3 +207,22 @@ def test_num_traces():
     assert num_traces == 5
     h(True, {"a": 2, "b": 1}, True, True)
     assert num_traces == 5
+
+
+def test_jitf_module_fun(getkey):
+    linear = eqx.nn.Linear(2, 3, key=getkey())
+    x = jrandom.normal(getkey(), (2,))
+    f = eqx.jitf(linear, filter_fn=eqx.is_array)
+    assert jnp.allclose(f(x), linear(x))
+
+    # Same structure, different weights: must not reuse the compiled `linear`.
+    linear2 = jax.tree_map(lambda u: u + 1, linear)
+    f2 = eqx.jitf(linear2, filter_fn=eqx.is_array)
+    assert jnp.allclose(f2(x), linear2(x))
+    assert not jnp.allclose(f2(x), f(x))
+
+    # The cache doesn't keep the Module alive.
+    ref = weakref.ref(linear2)
+    del f2, linear2
+    gc.collect()
+    assert ref() is None
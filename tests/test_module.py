@@ -1,5 +1,10 @@
+import copy
+import functools as ft
+import pickle
+from dataclasses import field
 from typing import Any
 
+import jax
 import pytest
 
 import equinox as eqx
@@ -130,3 +135,155 @@ def test_inheritance():
     m = MyModule7(value4=1, value7=2)
     assert m.weight4 == 1
     assert m.weight7 == 2
+
+
+def test_setattr_after_failed_init():
+    class MyModule(eqx.Module):
+        weight: Any
+
+        def __init__(self, fail):
+            self.weight = 1
+            if fail:
+                raise RuntimeError
+
+    m = MyModule(False)
+    with pytest.raises(RuntimeError):
+        MyModule(True)
+    with pytest.raises(AttributeError):
+        m.weight = 2
+
+
+def test_defaults(getkey):
+    class MyModule(eqx.Module):
+        weight: Any
+        bias: Any = 2
+        extra: Any = field(default=3, init=False)
+
+        def __init__(self, weight):
+            self.weight = weight
+
+    m = MyModule(1)
+    assert m.bias == 2
+    m2 = jax.tree_map(lambda x: x, m)
+    assert m2.bias == 2
+    assert m2.extra == 3
+
+    class MyModule2(MyModule):
+        bias: Any = 3
+
+    m = MyModule2(1)
+    assert m.bias == 3
+    assert copy.deepcopy(m) == m
+
+    linear = eqx.nn.Linear(2, 3, key=getkey())
+    assert pickle.loads(pickle.dumps(linear)) == linear
+
+
+def test_multiple_inheritance():
+    class MyModule1(eqx.Module):
+        a: Any
+
+    class MyModule2(eqx.Module):
+        b: Any
+
+    class MyModule3(MyModule1, MyModule2):
+        pass
+
+    m = MyModule3(1, 2)
+    assert jax.tree_leaves(m) == [1, 2]
+
+    class MyModule4(MyModule1):
+        c: Any
+
+    class MyModule5(MyModule1):
+        d: Any
+
+    class MyModule6(MyModule4, MyModule5):
+        pass
+
+    m = MyModule6(1, 2, 3)
+    assert jax.tree_leaves(m) == [1, 2, 3]
+
+
+def test_cached_property():
+    class MyModule(eqx.Module):
+        weight: Any
+
+        @ft.cached_property
+        def double(self):
+            return 2 * self.weight
+
+    m = MyModule(1)
+    assert m.double == 2
+    assert m.double == 2
+
+
+def test_redeclared_static_field():
+    class MyModule(eqx.Module):
+        a: Any = eqx.static_field(default=1)
+
+    class MyModule2(MyModule):
+        a: Any
+
+    assert jax.tree_leaves(MyModule()) == []
+    assert jax.tree_leaves(MyModule2(2)) == [2]
+
+
+def test_static_field():
+    class MyModule(eqx.Module):
+        weight: Any
+        size: int = eqx.static_field()
+
+    m = MyModule(1, 2)
+    leaves, treedef = jax.tree_flatten(m)
+    assert leaves == [1]
+    m2 = jax.tree_map(lambda x: x + 1, m)
+    assert m2.weight == 2
+    assert m2.size == 2
+    assert jax.tree_unflatten(treedef, leaves) == m
+    assert jax.tree_structure(MyModule(1, 3)) != treedef
+
+
+def test_noninit_fields():
+    class MyModule(eqx.Module):
+        weight: Any
+        extra: Any = field(default=3, init=False)
+        extras: list = field(default_factory=list, init=False)
+
+    m = MyModule(1)
+    assert m.extra == 3
+    assert m.extras == []
+    m2 = jax.tree_map(lambda x: x + 1, m)
+    assert m2.weight == 2
+    assert m2.extra == 3
+    assert m2.extras == []
+    assert jax.tree_leaves(m) == [1]
+
+    class MyModule2(eqx.Module):
+        a: Any
+        b: Any = field(init=False)
+
+        def __post_init__(self):
+            self.b = 2 * self.a
+
+    m = MyModule2(1.0)
+    assert m.b == 2.0
+    m2 = jax.tree_map(lambda x: x + 1, m)
+    assert m2.a == 2.0
+    assert m2.b == 4.0
+    assert jax.tree_leaves(m) == [1.0]
+
+
+def test_eq_and_hash(getkey):
+    linear = eqx.nn.Linear(2, 3, key=getkey())
+    linear2 = jax.tree_map(lambda x: x, linear)
+    assert linear == linear
+    assert linear == linear2
+    assert linear != eqx.nn.Linear(2, 3, key=getkey())
+    assert linear != eqx.nn.Identity()
+    assert linear != 1
+    assert hash(linear) == hash(linear)
+    assert hash(linear) == hash(linear2)
+    assert len({linear, linear}) == 1
+    assert linear2 in {linear}
+    assert len({linear, linear2}) == 1
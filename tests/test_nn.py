@@ -1,3 +1,5 @@
+import math
+
 import jax.numpy as jnp
 import jax.random as jrandom
 import pytest
@@ -7,7 +9,7 @@ import equinox as eqx
 
 def test_custom_init():
     with pytest.raises(TypeError):
-        eqx.nn.Linear(1, 1, 1)  # Matches the number of dataclass fields Linear has
+        eqx.nn.Linear(1, 1, 1, 1)  # Matches the number of dataclass fields Linear has
 
     with pytest.raises(TypeError):
         eqx.nn.Linear(3, 4)
@@ -35,6 +37,21 @@ def test_linear(getkey):
     x = jrandom.normal(getkey(), (3,))
     assert linear(x).shape == (4,)
 
+    # No bias
+    linear = eqx.nn.Linear(3, 4, use_bias=False, key=getkey())
+    assert linear.bias is None
+    x = jrandom.normal(getkey(), (3,))
+    assert linear(x).shape == (4,)
+
+
+def test_linear_init(getkey):
+    # Matches PyTorch: both weight and bias use the fan-in bound 1 / sqrt(in_features).
+    linear = eqx.nn.Linear(16, 1000, key=getkey())
+    lim = 1 / math.sqrt(16)
+    assert jnp.all(jnp.abs(linear.weight) <= lim)
+    assert jnp.all(jnp.abs(linear.bias) <= lim)
+    assert jnp.max(jnp.abs(linear.bias)) > 0.9 * lim
+
 
 def test_identity(getkey):
     identity1 = eqx.nn.Identity()